@@ -3,12 +3,75 @@ from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 import numpy as np
 import csv
+import os
+import threading
 import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from matplotlib.animation import FuncAnimation
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from datetime import datetime
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; the SSTF kernel then runs as plain Python
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        return lambda func: func
+
+@njit(cache=True, nogil=True)
+def _sstf_kernel(sorted_requests, first_index, start, head):
+    """Two-pointer SSTF walk outward from the head over sorted int32 requests"""
+    n = sorted_requests.shape[0]
+    sequence = np.empty(n + 1, dtype=np.int32)
+    sequence[0] = head
+    left, right = start - 1, start
+    current = head
+    seek_time = 0
+    
+    for step in range(1, n + 1):
+        if left < 0:
+            take_left = False
+        elif right >= n:
+            take_left = True
+        else:
+            left_dist = current - sorted_requests[left]
+            right_dist = sorted_requests[right] - current
+            # Ties go to the request that arrived first, matching a linear scan
+            take_left = left_dist < right_dist or (
+                left_dist == right_dist and first_index[left] < first_index[right])
+        
+        if take_left:
+            closest = sorted_requests[left]
+            left -= 1
+        else:
+            closest = sorted_requests[right]
+            right += 1
+        seek_time += abs(int(closest) - int(current))  # Widen so the total cannot wrap at int32
+        current = closest
+        sequence[step] = current
+        
+    return sequence, seek_time
+
+_sstf_kernel(np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.intp), 0, 0)  # Compile (or load from cache) at import
+
+def _memoized(method):
+    """Cache a DiskScheduler algorithm's (sequence, seek) result per call arguments"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._results:
+            sequence, seek_time = method(self, *args, **kwargs)
+            if isinstance(sequence, np.ndarray):
+                sequence.setflags(write=False)  # Shared between callers, so keep it immutable
+            self._results[key] = (sequence, seek_time)
+        return self._results[key]
+    return wrapper
+
 class ToolTip:
     """Enhanced tooltip class with better positioning and styling"""
     def __init__(self, widget, text):
@@ -43,110 +106,132 @@ class ToolTip:
 class DiskScheduler:
     """Implements disk scheduling algorithms with optimized calculations"""
     def __init__(self, requests, head, max_track):
-        self.requests = requests.copy()
         self.head = head
         self.max_track = max_track
-        self.validate_inputs()
-
-    def validate_inputs(self):
-        """Validate inputs upon initialization"""
-        if not isinstance(self.requests, list) or not all(isinstance(r, int) for r in self.requests):
-            raise ValueError("Requests must be a list of integers")
+        # Requests are held as a read-only int32 view rather than a defensive list copy
+        self._req_arr = self.validate_inputs(requests).astype(np.int32, copy=False).view()
+        self._req_arr.setflags(write=False)
+        
+        # Sort once; every algorithm works from these cached arrays
+        self._order = np.argsort(self._req_arr, kind='stable')
+        self._sorted = self._req_arr[self._order]
+        self._split_idx = np.searchsorted(self._sorted, self.head)
+        
+        self._results = {}
+
+    @property
+    def requests(self):
+        """Immutable int32 array of the requested tracks"""
+        return self._req_arr
+
+    def validate_inputs(self, requests):
+        """Validate inputs upon initialization and return the requests as an ndarray"""
+        if not isinstance(requests, (list, np.ndarray)):
+            raise ValueError("Requests must be a list or array of integers")
+        requests = np.asarray(requests)
+        if requests.size and requests.dtype.kind not in 'iu':
+            raise ValueError("Requests must be a list or array of integers")
         if not isinstance(self.head, int) or not isinstance(self.max_track, int):
             raise ValueError("Head and max track must be integers")
+        if self.max_track > np.iinfo(np.int32).max:
+            raise ValueError(f"Max track cannot exceed {np.iinfo(np.int32).max}")
         if self.head < 0 or self.head > self.max_track:
             raise ValueError(f"Head position must be between 0 and {self.max_track}")
-        if any(r < 0 or r > self.max_track for r in self.requests):
+        if ((requests < 0) | (requests > self.max_track)).any():
             raise ValueError(f"All requests must be between 0 and {self.max_track}")
+        return requests
 
     def _split_requests(self):
-        """Optimized request splitting with numpy for large datasets"""
-        requests = np.array(self.requests)
-        left = np.sort(requests[requests < self.head])[::-1]  # Descending
-        right = np.sort(requests[requests >= self.head])      # Ascending
-        return left.tolist(), right.tolist()
+        """Split the cached sorted requests around the head as zero-copy views"""
+        left = self._sorted[:self._split_idx][::-1]  # Descending
+        right = self._sorted[self._split_idx:]       # Ascending
+        return left, right
 
     def _calculate_seek_time(self, sequence):
-        """Vectorized seek time calculation"""
-        sequence = np.array(sequence)
-        return np.sum(np.abs(sequence[1:] - sequence[:-1]))
+        """Vectorized seek time calculation over an int32 ndarray sequence"""
+        return np.abs(np.diff(sequence)).sum(dtype=np.int64)  # Widen only the reduction
+
+    def _waypoint_seek_time(self, waypoints):
+        """Seek time of a path of monotonic runs, computed from its turning points alone"""
+        return sum(abs(int(b) - int(a)) for a, b in zip(waypoints, waypoints[1:]))
 
+    @_memoized
     def fcfs(self):
         """First-Come-First-Served with input validation"""
-        if not self.requests:
+        if not self._req_arr.size:
             return [self.head], 0
-        sequence = [self.head] + self.requests
+        sequence = np.concatenate(([self.head], self._req_arr), dtype=np.int32)
         return sequence, self._calculate_seek_time(sequence)
 
+    @_memoized
     def sstf(self):
-        """Shortest Seek Time First with early termination"""
-        if not self.requests:
+        """Shortest Seek Time First in O(n log n) via sort and two pointers"""
+        if not self._req_arr.size:
             return [self.head], 0
-            
-        sequence = [self.head]
-        pending = self.requests.copy()
-        current = self.head
-        seek_time = 0
-        
-        while pending:
-            distances = [abs(current - r) for r in pending]
-            min_idx = np.argmin(distances)
-            closest = pending.pop(min_idx)
-            seek_time += distances[min_idx]
-            current = closest
-            sequence.append(current)
-            
-        return sequence, seek_time
+        
+        # Original index of the first request in each run of equal tracks
+        first_index = self._order[np.searchsorted(self._sorted, self._sorted)]
+        
+        sequence, seek_time = _sstf_kernel(self._sorted, first_index, int(self._split_idx), self.head)
+        return sequence, int(seek_time)
 
+    @_memoized
     def scan(self, direction="left"):
         """SCAN algorithm with configurable direction"""
-        if not self.requests:
+        if not self._req_arr.size:
             return [self.head], 0
             
         left, right = self._split_requests()
         
         if direction == "left":
-            sequence = [self.head] + left + [0] + right
+            sequence = np.concatenate(([self.head], left, [0], right), dtype=np.int32)
+            seek_time = self._waypoint_seek_time([self.head, 0, *right[-1:]])
         else:
-            sequence = [self.head] + right + [self.max_track] + left
+            sequence = np.concatenate(([self.head], right, [self.max_track], left), dtype=np.int32)
+            seek_time = self._waypoint_seek_time([self.head, self.max_track, *left[-1:]])
             
-        return sequence, self._calculate_seek_time(sequence)
+        return sequence, seek_time
 
+    @_memoized
     def cscan(self):
         """Circular SCAN with optimized endpoint handling"""
-        if not self.requests:
+        if not self._req_arr.size:
             return [self.head], 0
             
         left, right = self._split_requests()
-        sequence = [self.head] + right + [self.max_track, 0] + left
-        return sequence, self._calculate_seek_time(sequence)
+        sequence = np.concatenate(([self.head], right, [self.max_track, 0], left), dtype=np.int32)
+        return sequence, self._waypoint_seek_time([self.head, self.max_track, 0, *left[:1], *left[-1:]])
 
+    @_memoized
     def look(self, direction="left"):
         """LOOK algorithm with direction control"""
-        if not self.requests:
+        if not self._req_arr.size:
             return [self.head], 0
             
         left, right = self._split_requests()
         
         if direction == "left":
-            sequence = [self.head] + left + right
+            sequence = np.concatenate(([self.head], left, right), dtype=np.int32)
+            seek_time = self._waypoint_seek_time([self.head, *left[-1:], *right[-1:]])
         else:
-            sequence = [self.head] + right + left
+            sequence = np.concatenate(([self.head], right, left), dtype=np.int32)
+            seek_time = self._waypoint_seek_time([self.head, *right[-1:], *left[-1:]])
             
-        return sequence, self._calculate_seek_time(sequence)
+        return sequence, seek_time
 
+    @_memoized
     def clook(self):
         """Circular LOOK with efficient request grouping"""
-        if not self.requests:
+        if not self._req_arr.size:
             return [self.head], 0
             
         left, right = self._split_requests()
-        sequence = [self.head] + right + left
-        return sequence, self._calculate_seek_time(sequence)
+        sequence = np.concatenate(([self.head], right, left), dtype=np.int32)
+        return sequence, self._waypoint_seek_time([self.head, *right[-1:], *left[:1], *left[-1:]])
 
     def calculate_metrics(self, seek_time, time_scale=1000):
         """Enhanced metrics calculation with edge case handling"""
-        if not self.requests:
+        if not self._req_arr.size:
             return 0, 0
             
         avg_seek = seek_time / len(self.requests)
@@ -155,6 +240,9 @@ class DiskScheduler:
 
 class DiskSchedulingApp:
     """Main application class with modern UI and enhanced features"""
+    ANIMATION_STEP_LIMIT = 500  # Longer sequences are drawn as a static plot
+    COLORS = plt.cm.tab10.colors
+    
     def __init__(self, root):
         self.root = root
         self.setup_window()
@@ -163,6 +251,9 @@ class DiskSchedulingApp:
         self.initialize_csv()
         self.animations = []
         self.comparison_mode = False
+        self.scheduler = None
+        self.simulation_thread = None
+        self.run_generation = 0  # Bumped by each run and by reset, so stale runs don't repaint
 
     def setup_window(self):
         """Configure main window properties"""
@@ -270,6 +361,7 @@ class DiskSchedulingApp:
 
         self.fig = Figure(figsize=(8, 4), dpi=100, facecolor='#f8f8f8')
         self.ax = self.fig.add_subplot(111)
+        self.plot_artists = {}  # Algorithm name -> (Line2D, Annotation), reused across runs
         self.canvas = FigureCanvasTkAgg(self.fig, master=vis_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
@@ -293,27 +385,31 @@ class DiskSchedulingApp:
     def validate_inputs(self):
         """Validate all user inputs with detailed error messages"""
         try:
-            requests = list(map(int, self.entry_requests.get().split()))
+            requests = np.array(self.entry_requests.get().split(), dtype=np.int32)
             head = int(self.entry_head.get())
             max_track = int(self.entry_max_track.get())
             time_scale = int(self.entry_time_scale.get())
 
-            if not requests:
+            if not requests.size:
                 raise ValueError("Request sequence cannot be empty")
             if head < 0 or head > max_track:
                 raise ValueError(f"Head position must be between 0 and {max_track}")
-            if any(r < 0 or r > max_track for r in requests):
+            if ((requests < 0) | (requests > max_track)).any():
                 raise ValueError(f"All requests must be between 0 and {max_track}")
             if time_scale <= 0:
                 raise ValueError("Time scale must be a positive number")
 
             return requests, head, max_track, time_scale
 
-        except ValueError as e:
+        except (ValueError, OverflowError) as e:
             raise ValueError(f"Invalid input: {str(e)}")
 
     def run_simulation(self, algorithms=None):
-        """Run simulation for selected or all algorithms"""
+        """Validate inputs and run the selected or all algorithms on a worker thread"""
+        if self.simulation_thread is not None and self.simulation_thread.is_alive():
+            self.status_var.set("A simulation is already running...")
+            return
+            
         try:
             start_time = time.time()
             requests, head, max_track, time_scale = self.validate_inputs()
@@ -322,40 +418,109 @@ class DiskSchedulingApp:
 
             self.clear_animations()  # Clear previous animations safely
 
-            scheduler = DiskScheduler(requests, head, max_track)
-            results = []
-
-            for algo in algo_list:
-                if algo == "FCFS":
-                    seq, seek = scheduler.fcfs()
-                elif algo == "SSTF":
-                    seq, seek = scheduler.sstf()
-                elif algo == "SCAN":
-                    seq, seek = scheduler.scan(direction)
-                elif algo == "C-SCAN":
-                    seq, seek = scheduler.cscan()
-                elif algo == "LOOK":
-                    seq, seek = scheduler.look(direction)
-                elif algo == "C-LOOK":
-                    seq, seek = scheduler.clook()
-                else:
-                    continue
-
-                avg_seek, throughput = scheduler.calculate_metrics(seek, time_scale)
-                results.append((algo, seq, seek, avg_seek, throughput))
-
-            self.display_results(results)
-            self.visualize_movement(results)
-            
-            for algo, seq, seek, avg_seek, throughput in results:
-                self.save_to_csv(algo, requests, head, max_track, seq, seek, avg_seek, throughput)
-
-            elapsed = time.time() - start_time
-            self.status_var.set(f"Completed {len(results)} simulations in {elapsed:.2f} seconds")
+            scheduler = self.get_scheduler(requests, head, max_track)
 
         except ValueError as e:
             messagebox.showerror("Input Error", str(e))
             self.status_var.set(f"Error: {str(e)}")
+            return
+        
+        self.run_generation += 1
+        self.status_var.set("Running simulation...")
+        self.simulation_thread = threading.Thread(target=self.simulate_in_background,
+                                                  args=(scheduler, algo_list, direction, time_scale,
+                                                        start_time, self.run_generation),
+                                                  daemon=True)
+        self.simulation_thread.start()
+
+    def simulate_in_background(self, scheduler, algo_list, direction, time_scale, start_time, generation):
+        """Compute results off the Tk thread, hand them back to the UI, then log them"""
+        try:
+            results = self.compute_results(scheduler, algo_list, direction, time_scale)
+        except Exception as e:
+            self.root.after(0, self.show_simulation_error, e, generation)
+            return
+            
+        self.root.after(0, self.finish_simulation, results, start_time, generation)
+        
+        try:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            requests_str = ' '.join(map(str, scheduler.requests.tolist()))  # Shared by every row of this run
+            csv_rows = [(timestamp, algo, requests_str, scheduler.head, scheduler.max_track,
+                         ' → '.join(map(str, np.asarray(seq).tolist())), seek, round(avg_seek, 2), round(throughput, 2))
+                        for algo, seq, seek, avg_seek, throughput in results]
+            self.save_to_csv(csv_rows)
+        except OSError as e:
+            self.root.after(0, self.show_csv_error, e)
+
+    def finish_simulation(self, results, start_time, generation):
+        """Display and plot completed results on the Tk thread unless a reset superseded them"""
+        if generation != self.run_generation:
+            return
+            
+        self.display_results(results)
+        self.visualize_movement(results)
+
+        elapsed = time.time() - start_time
+        self.status_var.set(f"Completed {len(results)} simulations in {elapsed:.2f} seconds")
+
+    def show_simulation_error(self, error, generation):
+        """Report a failure raised by the simulation worker thread"""
+        if generation != self.run_generation:
+            return
+            
+        messagebox.showerror("Simulation Error", str(error))
+        self.status_var.set(f"Error: {str(error)}")
+
+    def show_csv_error(self, error):
+        """Report a failure to log results, which are still shown on screen"""
+        messagebox.showerror("CSV Error", f"Results could not be saved to CSV: {str(error)}")
+        self.status_var.set(f"Error saving CSV: {str(error)}")
+
+    def run_algorithm(self, scheduler, algo, direction):
+        """Run a single algorithm by its display name, or return None if it is unknown"""
+        if algo == "FCFS":
+            return scheduler.fcfs()
+        elif algo == "SSTF":
+            return scheduler.sstf()
+        elif algo == "SCAN":
+            return scheduler.scan(direction)
+        elif algo == "C-SCAN":
+            return scheduler.cscan()
+        elif algo == "LOOK":
+            return scheduler.look(direction)
+        elif algo == "C-LOOK":
+            return scheduler.clook()
+        return None
+
+    def compute_results(self, scheduler, algo_list, direction, time_scale):
+        """Run the algorithms, overlapping SSTF with the rest when possible, and collect their metrics"""
+        if len(algo_list) > 1 and NUMBA_AVAILABLE:
+            # Only the compiled SSTF kernel releases the GIL for long; without Numba every
+            # algorithm would just serialize on the GIL, so threads would add overhead only
+            with ThreadPoolExecutor(max_workers=min(len(algo_list), os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(self.run_algorithm, scheduler, algo, direction)
+                           for algo in algo_list]
+                outputs = [future.result() for future in futures]
+        else:
+            outputs = [self.run_algorithm(scheduler, algo, direction) for algo in algo_list]
+        
+        results = []
+        for algo, output in zip(algo_list, outputs):
+            if output is None:
+                continue
+            seq, seek = output
+            avg_seek, throughput = scheduler.calculate_metrics(seek, time_scale)
+            results.append((algo, seq, seek, avg_seek, throughput))
+        return results
+
+    def get_scheduler(self, requests, head, max_track):
+        """Reuse the last scheduler, and its cached results, when the inputs are unchanged"""
+        if (self.scheduler is None or self.scheduler.head != head
+                or self.scheduler.max_track != max_track
+                or not np.array_equal(self.scheduler.requests, requests)):
+            self.scheduler = DiskScheduler(requests, head, max_track)
+        return self.scheduler
 
     def run_all_algorithms(self):
         """Run simulation for all available algorithms"""
@@ -384,63 +549,56 @@ class DiskSchedulingApp:
         self.output_text.config(state=tk.DISABLED)
         self.output_text.see(tk.END)
 
-    def save_to_csv(self, algorithm, requests, head, max_track, sequence, seek_time, avg_seek_time, throughput):
-        """Save results to CSV with timestamp and all parameters"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open("disk_scheduling_results.csv", mode="a", newline="", encoding='utf-8') as file:
+    def save_to_csv(self, rows):
+        """Append a batch of result rows to the CSV in a single file open"""
+        with open("disk_scheduling_results.csv", mode="a", newline="", encoding='utf-8',
+                  buffering=1 << 20) as file:
             writer = csv.writer(file)
-            writer.writerow([
-                timestamp,
-                algorithm,
-                ' '.join(map(str, requests)),
-                head,
-                max_track,
-                ' → '.join(map(str, sequence)),
-                seek_time,
-                round(avg_seek_time, 2),
-                round(throughput, 2)
-            ])
+            writer.writerows(rows)
 
     def visualize_movement(self, results):
         """Enhanced visualization with multiple algorithm support"""
-        self.fig.clear()
-        self.ax = self.fig.add_subplot(111)
+        self.clear_plot(keep={algo for algo, _, _, _, _ in results})
         
-        self.ax.grid(True, linestyle='--', alpha=0.7)
-        self.ax.set_facecolor('#f8f8f8')
-        self.ax.set_xlabel("Track Number", fontsize=10)
-        self.ax.set_ylabel("Step", fontsize=10)
-        
-        all_sequences = [seq for _, seq, _, _, _ in results]
-        max_track = max(max(seq) for seq in all_sequences) + 10 if all_sequences else 200
+        all_sequences = [np.asarray(seq) for _, seq, _, _, _ in results]
+        max_track = max(np.max(seq) for seq in all_sequences) + 10 if all_sequences else 200
         max_steps = max(len(seq) for seq in all_sequences) if all_sequences else 10
+        steps_axis = np.arange(max_steps)  # Shared y data; frames take O(1) slice views
         self.ax.set_xlim(0, max_track)
         self.ax.set_ylim(0, max_steps)
         
-        colors = plt.cm.tab10.colors
         lines = []
-        labels = []
+        annotations = []
         
         for i, (algo, seq, _, _, _) in enumerate(results):
-            line, = self.ax.plot([], [], marker='o', linestyle='-', 
-                                color=colors[i % len(colors)], 
-                                linewidth=2, markersize=6, 
-                                label=algo)
+            color = self.COLORS[i % len(self.COLORS)]
+            if algo in self.plot_artists:
+                line, annotation = self.plot_artists[algo]
+                line.set_color(color)
+                annotation.set_color(color)
+                line.set_data([], [])
+                annotation.set_text("")
+            else:
+                line, = self.ax.plot([], [], marker='o', linestyle='-', 
+                                    color=color, linewidth=2, markersize=6, 
+                                    label=algo)
+                # One reusable head-position label per algorithm instead of a new one per frame
+                annotation = self.ax.annotate("", (0, 0), textcoords="offset points",
+                                              xytext=(0,5), ha='center', fontsize=8,
+                                              color=color)
+                self.plot_artists[algo] = (line, annotation)
             lines.append(line)
-            labels.append(algo)
+            annotations.append(annotation)
         
         def update(frame):
-            annotations = []
-            for i, (_, seq, _, _, _) in enumerate(results):
+            for i, seq in enumerate(all_sequences):
                 steps = min(frame + 1, len(seq))
-                lines[i].set_data(seq[:steps], range(steps))
+                lines[i].set_data(seq[:steps], steps_axis[:steps])
                 
                 if steps > 0:
                     x, y = seq[steps-1], steps-1
-                    annotation = self.ax.annotate(f"{x}", (x, y), textcoords="offset points",
-                                                 xytext=(0,5), ha='center', fontsize=8,
-                                                 color=colors[i % len(colors)])
-                    annotations.append(annotation)
+                    annotations[i].xy = (x, y)
+                    annotations[i].set_text(f"{x}")
             
             return lines + annotations
         
@@ -448,13 +606,14 @@ class DiskSchedulingApp:
             self.ax.set_title(f"{results[0][0]} Algorithm - Head Movement", fontsize=11)
         else:
             self.ax.set_title("Algorithm Comparison - Head Movement", fontsize=11)
-            self.ax.legend(loc='upper right', fontsize=9)
+            self.ax.legend(handles=lines, loc='upper right', fontsize=9)
         
-        if results:
-            max_frames = max(len(seq) for _, seq, _, _, _ in results)
+        if results and max_steps > self.ANIMATION_STEP_LIMIT:
+            update(max_steps - 1)  # Too many steps to animate; draw the final path directly
+        elif results:
             try:
-                ani = FuncAnimation(self.fig, update, frames=max_frames, 
-                                  interval=400, blit=False, repeat=False)  # Changed blit=True to False for annotations
+                ani = FuncAnimation(self.fig, update, frames=max_steps, 
+                                  interval=400, blit=False, repeat=False)  # Blitting leaves artists hidden on later redraws
                 self.animations.append(ani)
             except Exception as e:
                 self.status_var.set(f"Animation error: {str(e)}")
@@ -462,6 +621,18 @@ class DiskSchedulingApp:
         
         self.canvas.draw()
 
+    def clear_plot(self, keep=()):
+        """Remove plotted artists except those for the algorithms in keep, preserving axes styling"""
+        for algo in list(self.plot_artists):
+            if algo not in keep:
+                line, annotation = self.plot_artists.pop(algo)
+                line.remove()
+                annotation.remove()
+        
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
     def clear_animations(self):
         """Clear existing animations safely to prevent memory leaks"""
         for ani in self.animations[:]:  # Iterate over a copy to allow modification
@@ -503,7 +674,7 @@ Disk Scheduling Algorithms:
    - Services the nearest request first
    - Better performance than FCFS
    - May cause starvation of distant requests
-   - Average performance case: O(n^2)
+   - Average performance case: O(n log n) (sort + two pointers)
 
 3. SCAN (Elevator Algorithm):
    - Moves back and forth across the disk
@@ -542,6 +713,7 @@ Performance Characteristics:
 
     def reset(self):
         """Reset all inputs and outputs to default state"""
+        self.run_generation += 1  # Discard the results of any simulation still in flight
         self.clear_animations()
         
         self.entry_requests.delete(0, tk.END)
@@ -558,12 +730,9 @@ Performance Characteristics:
         self.output_text.delete(1.0, tk.END)
         self.output_text.config(state=tk.DISABLED)
         
-        self.fig.clear()
-        self.ax = self.fig.add_subplot(111)
-        self.ax.grid(True, linestyle='--', alpha=0.7)
-        self.ax.set_facecolor('#f8f8f8')
-        self.ax.set_xlabel("Track Number", fontsize=10)
-        self.ax.set_ylabel("Step", fontsize=10)
+        self.clear_plot()
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(0, 1)
         self.ax.set_title("Disk Head Movement", fontsize=12)
         self.canvas.draw()
         